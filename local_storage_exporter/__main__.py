@@ -1,4 +1,5 @@
 import logging
+import signal
 import time
 import os
 
@@ -46,6 +47,14 @@ def main():
             pvc_label_keys=pvc_label_keys,
             include_pvc_labels_blob=include_pvc_labels_blob,
         )
+        # Stop the worker pool cleanly when Kubernetes sends SIGTERM
+        def handle_sigterm(signum, frame):
+            _logger.info("Received SIGTERM, shutting down...")
+            lse.shutdown()
+            raise SystemExit(0)
+
+        signal.signal(signal.SIGTERM, handle_sigterm)
+
         start_http_server(port)  # Metrics exporter server
         _logger.info(f"Started local storage exporter on port {port}")
         while True:
@@ -0,0 +1,122 @@
+/*
+ * Optional C implementation of the directory size walker.
+ *
+ * Sums st_blocks * 512 over a directory tree (allocated bytes, same
+ * accounting as the Python walkers in k8s.py) using openat/fdopendir/
+ * readdir/fstatat, with the GIL released for the whole walk so it runs
+ * truly in parallel from the usage thread pool. For PVs holding hundreds
+ * of thousands of files this removes the Python frame per entry that
+ * dominates once the fork+exec of 'du' is gone.
+ *
+ * The extension is opt-in; the exporter falls back to the Python walkers
+ * when it is not built. To build it in an image with a toolchain:
+ *
+ *   cc -shared -fPIC -O2 $(python3-config --includes) \
+ *      -o local_storage_exporter/_walksize.so local_storage_exporter/_walksize.c
+ */
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+#include <dirent.h>
+#include <errno.h>
+#include <fcntl.h>
+#include <stdint.h>
+#include <string.h>
+#include <sys/stat.h>
+#include <sys/types.h>
+#include <unistd.h>
+
+/* Walk the directory open at dirfd, returning allocated bytes of its
+ * entries (recursively). Takes ownership of dirfd. Unreadable entries
+ * and subdirectories are skipped, matching 'du' behavior. */
+static uint64_t
+walk(int dirfd)
+{
+    uint64_t total = 0;
+    DIR *dir = fdopendir(dirfd);
+    struct dirent *entry;
+    struct stat st;
+
+    if (dir == NULL) {
+        close(dirfd);
+        return 0;
+    }
+    while ((entry = readdir(dir)) != NULL) {
+        if (strcmp(entry->d_name, ".") == 0 || strcmp(entry->d_name, "..") == 0)
+            continue;
+        if (fstatat(dirfd, entry->d_name, &st, AT_SYMLINK_NOFOLLOW) != 0)
+            continue;
+        total += (uint64_t)st.st_blocks * 512;
+        if (S_ISDIR(st.st_mode)) {
+            int child = openat(dirfd, entry->d_name,
+                               O_RDONLY | O_DIRECTORY | O_CLOEXEC | O_NOFOLLOW);
+            if (child >= 0)
+                total += walk(child);
+        }
+    }
+    closedir(dir);
+    return total;
+}
+
+static PyObject *
+walksize(PyObject *self, PyObject *args)
+{
+    PyObject *pathobj;
+    const char *path;
+    uint64_t total = 0;
+    int err = 0;
+    int fd;
+    struct stat st;
+
+    if (!PyArg_ParseTuple(args, "O&:walksize", PyUnicode_FSConverter, &pathobj))
+        return NULL;
+    path = PyBytes_AS_STRING(pathobj);
+
+    Py_BEGIN_ALLOW_THREADS
+    if (lstat(path, &st) == 0) {
+        total = (uint64_t)st.st_blocks * 512;
+        if (S_ISDIR(st.st_mode)) {
+            fd = open(path, O_RDONLY | O_DIRECTORY | O_CLOEXEC);
+            if (fd >= 0)
+                total += walk(fd);
+            else
+                err = errno;
+        }
+    } else {
+        err = errno;
+    }
+    Py_END_ALLOW_THREADS
+
+    if (err != 0) {
+        errno = err;
+        PyErr_SetFromErrnoWithFilenameObject(PyExc_OSError,
+                                             PyUnicode_DecodeFSDefault(path));
+        Py_DECREF(pathobj);
+        return NULL;
+    }
+    Py_DECREF(pathobj);
+    return PyLong_FromUnsignedLongLong(total);
+}
+
+static PyMethodDef walksize_methods[] = {
+    {"walksize", walksize, METH_VARARGS,
+     "walksize(path) -> int\n\n"
+     "Return the allocated size of the directory tree at path in bytes\n"
+     "(st_blocks * 512, symlinks not followed). The GIL is released for\n"
+     "the duration of the walk."},
+    {NULL, NULL, 0, NULL},
+};
+
+static struct PyModuleDef walksize_module = {
+    PyModuleDef_HEAD_INIT,
+    "local_storage_exporter._walksize",
+    "C directory size walker (see module source for build instructions).",
+    -1,
+    walksize_methods,
+};
+
+PyMODINIT_FUNC
+PyInit__walksize(void)
+{
+    return PyModule_Create(&walksize_module);
+}
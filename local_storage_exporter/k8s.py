@@ -2,17 +2,30 @@ from __future__ import annotations
 import json
 import logging
 import re
+import shutil
 import subprocess
 import os
-from pathlib import Path
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from kubernetes import client, config
+from kubernetes import client, config, watch
+from kubernetes.client.exceptions import ApiException
 from kubernetes.client.models.v1_persistent_volume_list import V1PersistentVolumeList
 from kubernetes.client.models.v1_persistent_volume import V1PersistentVolume
 from kubernetes.client.models.v1_pod_list import V1PodList
 from kubernetes.client.models.v1_pod import V1Pod
+from prometheus_client import Gauge
 
-from . import utils, metrics
+from . import utils, metrics, quota, statx, uring_du, usage_cache, walker
+
+try:
+    # Optional C walker (see _walksize.c for build instructions); the Python
+    # walkers below are the fallback when it is not built.
+    from . import _walksize
+except ImportError:
+    _walksize = None
 
 
 _logger = utils.createLogger(__name__)
@@ -32,6 +45,68 @@ def _sanitize_label_key(key: str) -> str:
         sanitized = "_" + sanitized
 
     return sanitized
+
+
+# Maximum number of concurrent walks per mounted disk, so one slow disk
+# cannot occupy the whole pool and starve PVs on other disks.
+_DU_PER_MOUNT_CONCURRENCY = 4
+
+def _unescape_mountinfo(field: str) -> str:
+    """Decode the octal escapes (\\040 for space etc.) mountinfo uses."""
+    if "\\" not in field:
+        return field
+    return re.sub(r"\\([0-7]{3})", lambda m: chr(int(m.group(1), 8)), field)
+
+
+# Absolute path of 'du', resolved once. subprocess only takes its
+# posix_spawn fast path (vfork-style, no COW duplication of the Python
+# heap's page tables) for executables given with a directory component and
+# with close_fds=False, so the residual du calls pass both. Python-created
+# fds are CLOEXEC by default (PEP 446), so close_fds=False leaks nothing.
+_DU = shutil.which("du") or "du"
+
+
+def _walk_size(root: str) -> int:
+    """
+    Return the allocated size of the directory tree at root in bytes.
+
+    In-process replacement for 'du': os.scandir is a thin C wrapper over
+    getdents64+fstatat, so the walk pays no fork+exec per PV and keeps the
+    walker's inode cache warm across update cycles. Sums st_blocks * 512
+    (allocated bytes, matching 'du -s -B1'). Symlinks are not followed;
+    unreadable subdirectories are logged and skipped like 'du' does.
+
+    Raises:
+        OSError: If the root itself cannot be statted
+    """
+    # statx with AT_STATX_DONT_SYNC lets the kernel serve cached inode
+    # attributes without a metadata flush (relevant on networked or
+    # ZFS-backed disks); plain stat is the fallback.
+    use_statx = statx.available()
+    total = os.stat(root, follow_symlinks=False).st_blocks * 512
+    stack: deque[str] = deque([root])
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    try:
+                        if use_statx:
+                            blocks, is_dir = statx.blocks_and_isdir(entry.path)
+                        else:
+                            blocks = entry.stat(follow_symlinks=False).st_blocks
+                            is_dir = entry.is_dir(follow_symlinks=False)
+                    except OSError as e:
+                        _logger.error(f"Failed to stat {entry.path}: {e}")
+                        continue
+                    total += blocks * 512
+                    if is_dir:
+                        stack.append(entry.path)
+        except OSError as e:
+            _logger.error(f"Failed to scan directory {directory}: {e}")
+    return total
+
+
 class LocalStorageExporter:
     """
     A Kubernetes local storage exporter that monitors persistent volumes and mounted storage.
@@ -41,7 +116,10 @@ class LocalStorageExporter:
     """
     k8s_client: client.CoreV1Api
     storage_class_names: list[str] = []
-    host_path_to_volume_mount: dict[Path, Path] = {}
+    # Plain strings rather than Path: the mapping feeds the per-PV hot path,
+    # where str.startswith/os.path.join avoid the per-call PurePath
+    # allocations and hashing overhead of pathlib.
+    host_path_to_volume_mount: dict[str, str] = {}
     node_name: str
 
     def __init__(
@@ -72,13 +150,82 @@ class LocalStorageExporter:
             _logger.error(f"Failed to load k8s config: {e}")
             raise
 
-        # Find the host path to volume mount mapping
-        self.host_path_to_volume_mount = self.find_host_path_to_volume_mount()
+        with open(
+            "/var/run/secrets/kubernetes.io/serviceaccount/namespace", "r"
+        ) as file:
+            self._namespace = file.read().strip()
+
+        # The pod spec is immutable for our purposes, so fetch it once and
+        # reuse it for both mount discovery and the node name instead of
+        # issuing two identical API calls at startup.
+        pod = self.get_pod()
+
+        # Find the host path to volume mount mapping from the pod spec,
+        # then refine it with the kernel's view of our mount namespace:
+        # for spec entries that cross-validate against a mountinfo bind,
+        # the actually-mounted container path (post-subPath, post-symlink)
+        # replaces the declared mountPath.
+        self.host_path_to_volume_mount = self.find_host_path_to_volume_mount(pod)
+        self.host_path_to_volume_mount.update(
+            self.find_host_path_to_volume_mount_from_mountinfo(
+                self.host_path_to_volume_mount
+            )
+        )
         if len(self.host_path_to_volume_mount) == 0:
             _logger.error("Could not find any hostPath mounted volume.")
             raise RuntimeError("no hostPath mounted volume found")
 
-        self.node_name = self.get_pod().spec.node_name
+        # Precomputed prefix index of the mount mapping: host paths with a
+        # trailing separator, longest first, so per-PV path resolution is a
+        # handful of str.startswith checks (a C memcmp) with no Path or
+        # substring allocations per parent level. The trailing separator
+        # keeps sibling paths like /data2 from matching a /data mount, and
+        # longest-first makes nested mounts resolve to the deepest one.
+        self._mount_index: list[tuple[str, str]] = sorted(
+            (
+                (host_path.rstrip("/") + "/", mount_path)
+                for host_path, mount_path in self.host_path_to_volume_mount.items()
+            ),
+            key=lambda entry: len(entry[0]),
+            reverse=True,
+        )
+
+        # Most deployments have exactly one hostPath mount; bind a matcher
+        # specialized for that case so per-PV resolution is one startswith
+        # against values captured in the closure, with no index scan or
+        # tuple unpacking per candidate.
+        if len(self._mount_index) == 1:
+            host_prefix, mount_path = self._mount_index[0]
+            prefix_len = len(host_prefix)
+
+            def match_single(pv_path: str) -> tuple[str, str] | None:
+                if pv_path.startswith(host_prefix):
+                    return mount_path, os.path.join(
+                        mount_path, pv_path[prefix_len:]
+                    )
+                return None
+
+            self._match_mount = match_single
+
+        # Cache PV sizes between ticks; inotify events invalidate only the
+        # PVs whose subtree actually changed, so idle volumes are not
+        # re-walked every cycle.
+        self._usage_cache = usage_cache.UsageCache(
+            list(self.host_path_to_volume_mount.values())
+        )
+
+        # Device number of each mounted volume root. A PV whose path sits on
+        # a different device than its mount root is its own filesystem (the
+        # one-disk-per-PV local-volume-provisioner topology), and its usage
+        # can be read with a single statvfs instead of a tree walk.
+        self._mount_devices: dict[str, int] = {}
+        for mount_path in self.host_path_to_volume_mount.values():
+            try:
+                self._mount_devices[mount_path] = os.stat(mount_path).st_dev
+            except OSError as e:
+                _logger.error(f"Failed to stat mount {mount_path}: {e}")
+
+        self.node_name = pod.spec.node_name
         self.storage_class_names = storage_class_names
         self.pvc_label_keys = pvc_label_keys
         self.include_pvc_labels_blob = include_pvc_labels_blob
@@ -122,11 +269,74 @@ class LocalStorageExporter:
                 f"sanitization: {', '.join(sorted(duplicates))}"
             )
 
-        self.pv_used_bytes_gauge, self.pv_capacity_bytes_gauge = metrics.create_pv_gauges(
+        # PV watch cache: a daemon thread consumes ADDED/MODIFIED/DELETED
+        # events and keeps a local dict of PVs, so get_pvs serves snapshots
+        # from memory instead of issuing a full LIST against the API server
+        # on every tick.
+        self._pv_cache: dict[str, V1PersistentVolume] = {}
+        self._pv_cache_lock = threading.Lock()
+        self._pv_cache_synced = threading.Event()
+        # Cleared if the API server rejects the spec.storageClassName field
+        # selector, in which case list/watch fall back to transferring all
+        # PVs and filtering client-side in get_pvs (which happens anyway).
+        self._field_selector_supported = True
+        threading.Thread(
+            target=self._watch_pvs, name="pv-watch", daemon=True
+        ).start()
+
+        # Worker pool for PV usage walks; walking PVs concurrently keeps many
+        # stat calls in flight so the disk queue stays full instead of paying
+        # one full walk latency per PV serially.
+        self._pool = ThreadPoolExecutor(
+            max_workers=int(os.environ.get("DU_CONCURRENCY", "16")),
+            thread_name_prefix="pv-usage",
+        )
+        self._mount_semaphores: dict[str, threading.Semaphore] = defaultdict(
+            lambda: threading.Semaphore(_DU_PER_MOUNT_CONCURRENCY)
+        )
+        # Per-tick results of the batched 'du' prefetch (USE_DU=1 only).
+        self._du_batch_sizes: dict[str, int] = {}
+        # Long-lived walker subprocess (USE_WALKER_SUBPROCESS=1 only);
+        # spawned lazily on first use.
+        self._walker_client = walker.WalkerClient()
+
+        (
+            self.pv_used_bytes_gauge,
+            self.pv_capacity_bytes_gauge,
+            self._pv_labelnames,
+        ) = metrics.create_pv_gauges(
             extra_labelnames=sanitized_labelnames,
             include_pvc_labels_blob=include_pvc_labels_blob,
         )
 
+        # Bound gauge children per PV UID so each tick sets values on cached
+        # handles instead of rebuilding the label set (and re-fetching PVC
+        # labels) every time. Also used to remove series of deleted PVs and
+        # to rebind when the capacity (part of the label set) changes.
+        self._gauge_cache: dict[str, tuple[Gauge, Gauge, tuple[str, ...], int]] = {}
+        # Last published capacity per PV UID; capacity almost never changes,
+        # so the gauge is only written when it does.
+        self._last_capacity: dict[str, int] = {}
+        # Per-mount scrape specs, precomputed once: the mount set and its
+        # label values are fixed for the process lifetime, so each tick
+        # reuses the stringified statvfs path and the bound gauge children
+        # instead of converting Paths and building label dicts per mount.
+        self._mount_specs: list[tuple[str, Gauge, Gauge, Gauge]] = []
+        for host_path, volume_mount_path in self.host_path_to_volume_mount.items():
+            labels = {
+                "node_name": self.node_name,
+                "host_path": host_path,
+                "volume_mount_path": volume_mount_path,
+            }
+            self._mount_specs.append(
+                (
+                    volume_mount_path,
+                    metrics.mounted_disk_capacity_gauge.labels(**labels),
+                    metrics.mounted_disk_used_gauge.labels(**labels),
+                    metrics.mounted_disk_available_gauge.labels(**labels),
+                )
+            )
+
     def get_pod(self) -> V1Pod:
         """
         Get the current pod where this exporter is running.
@@ -141,10 +351,7 @@ class LocalStorageExporter:
             LookupError: If exactly one pod cannot be found with the expected hostname
         """
         pod_hostname = os.getenv("HOSTNAME")
-        with open(
-            "/var/run/secrets/kubernetes.io/serviceaccount/namespace", "r"
-        ) as file:
-            pod_namespace = file.read().strip()
+        pod_namespace = self._namespace
 
         pods: V1PodList = self.k8s_client.list_namespaced_pod(
             namespace=pod_namespace, field_selector=f"metadata.name={pod_hostname}"
@@ -187,138 +394,445 @@ class LocalStorageExporter:
             )
         return containers[0]
 
-    def find_host_path_to_volume_mount(self) -> dict[Path, Path]:
+    def find_host_path_to_volume_mount(self, pod: V1Pod) -> dict[str, str]:
         """
         Discover the mapping between host paths and container volume mount paths.
-        
-        Examines the current pod's volumes and volume mounts to create a mapping
+
+        Examines the given pod's volumes and volume mounts to create a mapping
         from host filesystem paths to container mount paths. This is essential
         for translating persistent volume paths to accessible container paths.
-        
+
+        Args:
+            pod: The exporter's own pod, as fetched by get_pod
+
         Returns:
-            dict[Path, Path]: Mapping from host paths to volume mount paths
+            dict[str, str]: Mapping from host paths to volume mount paths
         """
-        pod = self.get_pod()
         container = LocalStorageExporter.get_container(pod)
         mount_paths = {}
         for volume in pod.spec.volumes:
             if volume.host_path:
                 for volume_mount in container.volume_mounts:
                     if volume_mount.name == volume.name:
-                        mount_paths[Path(volume.host_path.path)] = Path(
-                            volume_mount.mount_path
-                        )
+                        mount_paths[volume.host_path.path] = volume_mount.mount_path
                         break
         return mount_paths
 
+    def find_host_path_to_volume_mount_from_mountinfo(
+        self, spec_mounts: dict[str, str]
+    ) -> dict[str, str]:
+        """
+        Refine the spec-derived mount mapping with /proc/self/mountinfo.
+
+        hostPath volumes show up in the container's mount namespace as bind
+        mounts, so entries whose 'root' field matches a spec hostPath can
+        take the actually-mounted container path (post-subPath,
+        post-symlink) instead of the declared mountPath. The root field is
+        relative to the bind source's own filesystem - for a hostPath on a
+        dedicated disk it is not host-absolute - so only entries that
+        cross-validate against the spec are accepted; everything else
+        keeps the spec value.
+
+        Args:
+            spec_mounts: The pod-spec mapping from find_host_path_to_volume_mount
+
+        Returns:
+            dict[str, str]: Mapping from host paths to mounted container
+                paths for the cross-validated subset of spec_mounts; empty
+                if parsing fails
+        """
+        mount_paths: dict[str, str] = {}
+        try:
+            with open("/proc/self/mountinfo") as f:
+                for line in f:
+                    fields = line.split()
+                    # Format: id parent major:minor root mountpoint opts ... - fstype source ...
+                    root = _unescape_mountinfo(fields[3])
+                    if root in spec_mounts:
+                        mount_paths[root] = _unescape_mountinfo(fields[4])
+        except OSError as e:
+            _logger.error(f"Failed to parse /proc/self/mountinfo: {e}")
+        return mount_paths
+
+    def _watch_pvs(self):
+        """
+        Maintain the local PV cache from a Kubernetes watch stream.
+
+        Runs in a daemon thread. Lists once to seed the cache, then applies
+        ADDED/MODIFIED/DELETED deltas from the watch. A 410 Gone (expired
+        resourceVersion) triggers an immediate re-list; other errors are
+        retried after a short backoff.
+        """
+        # With a single configured storage class the filter can be pushed to
+        # the API server, so irrelevant PVs never cross the wire. Multiple
+        # classes cannot share one watch selector, and filtering is cheap
+        # client-side, so those keep the unfiltered stream.
+        field_selector = None
+        if len(self.storage_class_names) == 1:
+            field_selector = (
+                f"spec.storageClassName={self.storage_class_names[0]}"
+            )
+        while True:
+            kwargs = {}
+            if field_selector and self._field_selector_supported:
+                kwargs["field_selector"] = field_selector
+            try:
+                # Bounded timeout so a hung LIST cannot stall the watch
+                # thread forever; the watch stream itself stays unbounded.
+                # resourceVersion=0 lets the API server answer the seeding
+                # LIST from its in-memory watch cache instead of a quorum
+                # read against etcd - the watch stream then catches the
+                # cache up, so strict read consistency is not needed here.
+                pvs: V1PersistentVolumeList = self.k8s_client.list_persistent_volume(
+                    resource_version="0",
+                    resource_version_match="NotOlderThan",
+                    _request_timeout=30,
+                    **kwargs,
+                )
+                with self._pv_cache_lock:
+                    self._pv_cache = {pv.metadata.name: pv for pv in pvs.items}
+                self._pv_cache_synced.set()
+                for event in watch.Watch().stream(
+                    self.k8s_client.list_persistent_volume,
+                    resource_version=pvs.metadata.resource_version,
+                    allow_watch_bookmarks=True,
+                    timeout_seconds=0,
+                    **kwargs,
+                ):
+                    if event["type"] == "BOOKMARK":
+                        continue
+                    pv = event["object"]
+                    with self._pv_cache_lock:
+                        if event["type"] == "DELETED":
+                            self._pv_cache.pop(pv.metadata.name, None)
+                        else:
+                            self._pv_cache[pv.metadata.name] = pv
+            except ApiException as e:
+                if e.status == 400 and kwargs:
+                    _logger.warning(
+                        "API server rejected the storageClassName field selector, "
+                        "falling back to client-side filtering"
+                    )
+                    self._field_selector_supported = False
+                    continue
+                if e.status == 410:
+                    _logger.info("PV watch expired (410 Gone), re-listing...")
+                    continue
+                _logger.error(f"PV watch failed: {e}. Retrying in 5 seconds...")
+                time.sleep(5)
+            except Exception as e:
+                _logger.error(f"PV watch failed: {e}. Retrying in 5 seconds...")
+                time.sleep(5)
+
     def get_pvs(self) -> V1PersistentVolumeList:
         """
         Retrieve persistent volumes filtered by configured storage classes.
-        
-        Fetches all persistent volumes from the cluster and filters them to only
+
+        Serves a snapshot of the watch-maintained PV cache filtered to only
         include those with storage classes specified in the exporter configuration.
-        
+
         Returns:
             V1PersistentVolumeList: List of persistent volumes matching the storage classes
         """
-        pvs: V1PersistentVolumeList = self.k8s_client.list_persistent_volume()
-        pvs.items = [
-            pv
-            for pv in pvs.items
-            if pv.spec.storage_class_name in self.storage_class_names
-        ]
-        return pvs
+        if not self._pv_cache_synced.wait(timeout=30):
+            _logger.warning("PV watch cache has not synced yet, metrics may lag")
+        with self._pv_cache_lock:
+            items = [
+                pv
+                for pv in self._pv_cache.values()
+                if pv.spec.storage_class_name in self.storage_class_names
+            ]
+        return V1PersistentVolumeList(items=items)
 
-    def get_pv_usage(self, pv: V1PersistentVolume) -> int | None:
+    def _resolve_local_path(self, pv: V1PersistentVolume) -> tuple[str, str] | None:
         """
-        Calculate the disk usage of a persistent volume in bytes.
-        
-        Determines the actual disk usage by mapping the persistent volume's path
-        to a local container path and using the 'du' command to measure usage.
-        
+        Resolve a persistent volume's host path to a path inside the container.
+
         Args:
-            pv: The persistent volume to measure
-            
+            pv: The persistent volume to resolve
+
         Returns:
-            int | None: Size in bytes, or None if measurement fails
+            tuple[str, str] | None: The mounted volume root and the local
+                path of the PV below it, or None (with an error logged) if
+                the PV has no usable path or no matching mount
         """
         if pv.spec.local is not None:
-            pv_path = Path(pv.spec.local.path)
+            pv_path = pv.spec.local.path
         elif pv.spec.host_path is not None:
-            pv_path = Path(pv.spec.host_path.path)
+            pv_path = pv.spec.host_path.path
         else:
             _logger.error(
                 f"PV {pv.metadata.name} does not have local or host path spec"
             )
             return None
 
-        # Find the local path for the mounted volume
-        local_path: Path | None = None
-        for parent in pv_path.parents:
-            if parent in self.host_path_to_volume_mount:
-                relative = pv_path.relative_to(parent)
-                local_path = self.host_path_to_volume_mount[parent] / relative
-                break
-
-        if local_path is None:
+        # Find the local path for the mounted volume via the mount matcher
+        # (the longest-first index scan, or its single-mount specialization)
+        matched = self._match_mount(pv_path)
+        if matched is None:
             _logger.error(
                 f"Could not find host path mount path for {pv_path}. Did you mount the correct path?"
             )
             return None
-        if not local_path.exists():
+        mount_root, local_path = matched
+        if not os.path.lexists(local_path):
             # Should not happen, but just in case
             _logger.error(f"Path {local_path} does not exist")
             return None
+        return mount_root, local_path
+
+    def _match_mount(self, pv_path: str) -> tuple[str, str] | None:
+        """
+        Match a PV host path against the mount index.
+
+        Returns:
+            tuple[str, str] | None: The mounted volume root and the local
+                path of the PV below it, or None if no mount covers pv_path.
+                Instances with a single mount replace this with a
+                specialized closure bound in __init__.
+        """
+        for host_prefix, mount_path in self._mount_index:
+            if pv_path.startswith(host_prefix):
+                return mount_path, os.path.join(
+                    mount_path, pv_path[len(host_prefix):]
+                )
+        return None
+
+    def get_pv_usage(self, pv: V1PersistentVolume) -> int | None:
+        """
+        Calculate the disk usage of a persistent volume in bytes.
+
+        Determines the actual disk usage by mapping the persistent volume's path
+        to a local container path and walking it to measure usage.
+
+        Args:
+            pv: The persistent volume to measure
+
+        Returns:
+            int | None: Size in bytes, or None if measurement fails
+        """
+        resolved = self._resolve_local_path(pv)
+        if resolved is None:
+            return None
+        mount_root, local_path = resolved
+
+        # A PV that is its own filesystem (one disk per PV) is answered by
+        # the kernel in one statvfs call; only PVs sharing a filesystem with
+        # their mount root need a walk.
+        if self._is_own_filesystem(mount_root, local_path):
+            return self._statvfs_size(local_path)
+
+        # Limit concurrent walks per mounted disk so one slow disk cannot
+        # starve the others when many PVs are measured in parallel.
+        with self._mount_semaphores[mount_root]:
+            return self._measure_usage(local_path)
+
+    def _is_own_filesystem(self, mount_root: str, local_path: str) -> bool:
+        """
+        Check whether local_path is a filesystem of its own below mount_root.
+
+        With the typical local-volume-provisioner layout each PV directory
+        is a separate mount, so its device number differs from the mount
+        root's; for plain subdirectories the devices match.
+        """
+        device = self._mount_devices.get(mount_root)
+        if device is None:
+            return False
+        try:
+            return os.stat(local_path).st_dev != device
+        except OSError as e:
+            _logger.error(f"Failed to stat {local_path}: {e}")
+            return False
+
+    def _statvfs_size(self, local_path: str) -> int | None:
+        """
+        Read the used bytes of the filesystem mounted at local_path.
+
+        O(1) replacement for a tree walk on filesystem-isolated PVs: the
+        kernel already tracks the block counts, so usage is
+        f_frsize * (f_blocks - f_bfree) regardless of file count.
+
+        Returns:
+            int | None: Used bytes, or None if statvfs fails
+        """
+        try:
+            stat = os.statvfs(local_path)
+        except OSError as e:
+            _logger.error(f"Failed to statvfs {local_path}: {e}")
+            return None
+        return stat.f_frsize * (stat.f_blocks - stat.f_bfree)
+
+    def _measure_usage(self, local_path: str) -> int | None:
+        """
+        Measure the allocated size of a resolved local path in bytes.
+
+        Serves the cached size when the inotify cache reports the subtree
+        unchanged since the last walk. Otherwise prefers the io_uring walker,
+        falling back to the in-process scandir walker. Setting USE_DU=1
+        forces the original 'du' subprocess instead, for parity testing
+        against the in-process walkers.
+
+        Args:
+            local_path: Resolved path of the volume inside the container
+
+        Returns:
+            int | None: Size in bytes, or None if measurement fails
+        """
+        cached = self._usage_cache.get(local_path)
+        if cached is not None:
+            return cached
+        size = self._compute_usage(local_path)
+        if size is not None:
+            self._usage_cache.put(local_path, size)
+        else:
+            # The miss cleared the dirty markers under local_path; a failed
+            # recompute must re-mark it so the stale pre-change size is not
+            # served on the next tick.
+            self._usage_cache.invalidate(local_path)
+        return size
+
+    def _compute_usage(self, local_path: str) -> int | None:
+        """Walk local_path with the best available walker (no caching)."""
+        # USAGE_SOURCE=quota|auto reads the kernel's project-quota counter
+        # (one syscall) instead of walking; 'auto' probes quietly and falls
+        # through, 'quota' logs the failure. Default is 'walk'.
+        usage_source = os.environ.get("USAGE_SOURCE", "walk")
+        if usage_source in ("quota", "auto"):
+            try:
+                return quota.size(local_path)
+            except OSError as e:
+                if usage_source == "quota":
+                    _logger.error(
+                        f"Quota lookup failed for {local_path}: {e}, falling back to walk"
+                    )
+                else:
+                    _logger.debug(f"Quota lookup unavailable for {local_path}: {e}")
+
+        if os.environ.get("USE_DU") == "1":
+            return self._du_size(local_path)
+
+        if os.environ.get("USE_WALKER_SUBPROCESS") == "1":
+            try:
+                return self._walker_client.size(local_path)
+            except OSError as e:
+                _logger.error(
+                    f"Walker subprocess failed for {local_path}: {e}, walking in-process"
+                )
+
+        if _walksize is not None:
+            try:
+                # C walker: no Python frame per entry, GIL released for the
+                # whole walk so pool workers run truly in parallel.
+                return _walksize.walksize(local_path)
+            except OSError as e:
+                _logger.error(
+                    f"C walker failed for {local_path}: {e}, falling back"
+                )
+
+        if uring_du.available():
+            try:
+                return uring_du.size(local_path)
+            except OSError as e:
+                _logger.error(
+                    f"io_uring walk failed for {local_path}: {e}, falling back to scandir walk"
+                )
 
+        try:
+            return _walk_size(local_path)
+        except OSError as e:
+            _logger.error(f"Failed to get volume usage for {local_path}: {e}")
+            return None
+
+    def _prefetch_du_sizes(self, pvs: list[V1PersistentVolume]):
+        """
+        Measure all PVs sharing a mounted disk with a single 'du' invocation.
+
+        Only used on the USE_DU=1 legacy path: 'du -sb path1 ... pathN'
+        prints one line per argument, so grouping PVs by mount drops the
+        fork+exec count from one per PV to one per disk per tick. Results
+        are stored for _du_size to serve; paths missing from du's output
+        fall back to a per-path 'du' call there.
+        """
+        groups: dict[str, list[str]] = defaultdict(list)
+        for pv in pvs:
+            resolved = self._resolve_local_path(pv)
+            if resolved is None:
+                continue
+            mount_root, local_path = resolved
+            groups[mount_root].append(local_path)
+
+        sizes: dict[str, int] = {}
+        for mount_root, paths in groups.items():
+            # No check=True: du exits non-zero if any subtree was unreadable
+            # but still prints the sizes it could compute. Output is kept as
+            # bytes - int() accepts them directly, so nothing forces a full
+            # stdout decode through the locale codec.
+            result = subprocess.run(
+                [_DU, "-sb", "--", *paths],
+                capture_output=True,
+                close_fds=False,
+            )
+            for line in result.stdout.splitlines():
+                size, _, path = line.partition(b"\t")
+                if path:
+                    sizes[os.fsdecode(path)] = int(size)
+        self._du_batch_sizes = sizes
+
+    def _du_size(self, local_path: str) -> int | None:
+        """
+        Measure usage with a 'du -sb' subprocess (legacy path).
+
+        Args:
+            local_path: Resolved path of the volume inside the container
+
+        Returns:
+            int | None: Size in bytes, or None if 'du' fails
+        """
+        batched = self._du_batch_sizes.get(local_path)
+        if batched is not None:
+            return batched
         try:
             # Use 'du' to get the size of the directory in bytes
             # The number and path are separated by a tab character
-            # Example output for 'du -sb /path/to/volume': 
-            # 12345678  /path/to/volume 
-            result = result = subprocess.run(
-                ["du", "-sb", os.fspath(local_path)],
+            # Example output for 'du -sb /path/to/volume':
+            # 12345678  /path/to/volume
+            # Output stays as bytes; int() accepts the size field directly.
+            result = subprocess.run(
+                [_DU, "-sb", local_path],
                 capture_output=True,
-                text=True,
                 check=True,
+                close_fds=False,
             )
-            size = result.stdout.split("\t")[0]
+            size = result.stdout.split(b"\t")[0]
             return int(size)
         except Exception as e:
             _logger.error(f"Failed to get volume usage for {local_path}: {e}")
             return None
 
-    def get_mount_storage_info(self, volume_mount_path: Path) -> tuple[int, int, int]:
+    def get_mount_storage_info(self, volume_mount_path: str) -> tuple[int, int, int]:
         """
         Get filesystem storage information for a mounted volume path.
-        
-        Uses the 'df' command to retrieve capacity, used space, and available space
-        for the filesystem containing the specified mount path.
-        
+
+        Uses os.statvfs to retrieve capacity, used space, and available space
+        for the filesystem containing the specified mount path. This is a
+        single syscall, replacing the 'df' subprocess fork per mount per tick.
+
         Args:
             volume_mount_path: Path to the mounted volume
-            
+
         Returns:
             tuple[int, int, int]: Capacity, used, and available space in bytes
-            
+
         Raises:
-            subprocess.CalledProcessError: If the df command fails
+            OSError: If the path cannot be statted
         """
-        result = subprocess.run(
-            ["df", "-B1", os.fspath(volume_mount_path)],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        lines = result.stdout.split("\n")
-        # The second line contains the disk usage information
-        # Example output for 'df -B1 /volumes':
-        # Filesystem     1B-blocks       Used    Available Use% Mounted on
-        # /dev/root   103865303040 49565679616 54282846208  48% /volumes
-        volume_mount_info = lines[1].split()
-        volume_mount_capacity = int(volume_mount_info[1])
-        volume_mount_used = int(volume_mount_info[2])
-        volume_mount_available = int(volume_mount_info[3])
-        return volume_mount_capacity, volume_mount_used, volume_mount_available
+        stat = os.statvfs(volume_mount_path)
+        capacity = stat.f_blocks * stat.f_frsize
+        # 'available' counts blocks free to unprivileged users, while 'used'
+        # is derived from all free blocks - this matches what df reports.
+        available = stat.f_bavail * stat.f_frsize
+        used = capacity - stat.f_bfree * stat.f_frsize
+        return capacity, used, available
 
     def update_pv_metrics(self):
         """
@@ -329,6 +843,7 @@ class LocalStorageExporter:
         usage and capacity information. Only processes volumes on the current node.
         """
         pvs = self.get_pvs()
+        node_pvs: list[V1PersistentVolume] = []
         pv: V1PersistentVolume
         for pv in pvs.items:
             pv_node_name = pv.spec.node_affinity.required.node_selector_terms[0].match_expressions[0].values[0]
@@ -337,95 +852,181 @@ class LocalStorageExporter:
                     f"Skipping PV {pv.metadata.name} because it is not on this node ({self.node_name} but in node {pv_node_name})"
                 )
                 continue
-            usage = self.get_pv_usage(pv)
-            pvc_name = pv.spec.claim_ref.name
-            pvc_namespace = pv.spec.claim_ref.namespace
+            node_pvs.append(pv)
+
+        if os.environ.get("USE_DU") == "1":
+            self._prefetch_du_sizes(node_pvs)
+
+        # Walk all PVs concurrently so the kernel sees many in-flight stat
+        # calls; gauges are still published from this thread to keep metric
+        # updates single-threaded.
+        futures = {self._pool.submit(self.get_pv_usage, pv): pv for pv in node_pvs}
+        for future in as_completed(futures):
+            pv = futures[future]
+            usage = future.result()
             pv_name = pv.metadata.name
-            storage_path = (
-                pv.spec.local.path if pv.spec.local else pv.spec.host_path.path
-            )
             pv_capacity = utils.convert_storage_capacity_to_bytes(
                 pv.spec.capacity["storage"]
             )
-            storage_class_name = pv.spec.storage_class_name
-            try:
-                pvc = self.k8s_client.read_namespaced_persistent_volume_claim(
-                    name=pvc_name, namespace=pvc_namespace
-                )
-                raw_labels = pvc.metadata.labels or {}
-            except Exception as e:
-                _logger.error(f"Failed to fetch PVC {pvc_namespace}/{pvc_name}: {e}")
-                raw_labels = {}
-            label_kwargs = {_sanitize_label_key(k): raw_labels.get(k, "") for k in self.pvc_label_keys}
-            if self.include_pvc_labels_blob:
-                promoted = set(self.pvc_label_keys)
-                remaining = {k: v for k, v in raw_labels.items() if k not in promoted}
-                label_kwargs["pvc_labels"] = json.dumps(remaining, sort_keys=True)
-            pv_used_bytes_gauge = self.pv_used_bytes_gauge.labels(
-                node_name=self.node_name,
-                pvc_name=pvc_name,
-                pvc_namespace=pvc_namespace,
-                pv_name=pv_name,
-                storage_path=storage_path,
-                pv_capacity=pv_capacity,
-                storage_class_name=storage_class_name,
-                **label_kwargs,
+
+            used_gauge, capacity_gauge, _, _ = self._get_pv_gauge_children(
+                pv, pv_capacity
             )
             if usage is not None:
-                pv_used_bytes_gauge.set(usage)
+                used_gauge.set(usage)
             else:
-                pv_used_bytes_gauge.set(-1)
+                used_gauge.set(-1)
                 _logger.error(
                     f"Failed to get usage for PV {pv_name}, so setting it to -1"
                 )
 
-            # This is a constant value, so we don't need to update it every time
-            # However this is a simple way to ensure that the metric is always updated when there was a change instead of tracking creation/deletion events
-            # If we can just extract this information from the used_bytes_gauge label using promql (or different method), we can remove this gauge.
-            self.pv_capacity_bytes_gauge.labels(
-                node_name=self.node_name,
-                pvc_name=pvc_name,
-                pvc_namespace=pvc_namespace,
-                pv_name=pv_name,
-                storage_path=storage_path,
-                pv_capacity=pv_capacity,
-                storage_class_name=storage_class_name,
-                **label_kwargs,
-            ).set(pv_capacity)
+            # Capacity is effectively constant per PV, so only write the
+            # gauge when the value actually changed (e.g. a volume expansion)
+            # instead of taking the metric lock for every PV every tick.
+            uid = pv.metadata.uid
+            if self._last_capacity.get(uid) != pv_capacity:
+                capacity_gauge.set(pv_capacity)
+                self._last_capacity[uid] = pv_capacity
+
+        self._evict_deleted_pv_gauges(node_pvs)
+
+    def _get_pv_gauge_children(
+        self, pv: V1PersistentVolume, pv_capacity: int
+    ) -> tuple[Gauge, Gauge, tuple[str, ...], int]:
+        """
+        Get (creating and caching if needed) the bound gauge children for a PV.
+
+        The label set of a PV only changes when its capacity does (e.g. a
+        volume expansion), so the labels() lookup - and the PVC read backing
+        the promoted PVC labels - happens once per PV rather than once per
+        tick; a capacity change retires the old series and rebinds.
+
+        Args:
+            pv: The persistent volume the gauges belong to
+            pv_capacity: The PV capacity in bytes (part of the label set)
+
+        Returns:
+            tuple[Gauge, Gauge, tuple[str, ...], int]: Bound used/capacity
+                gauge children, the ordered label values identifying the
+                series, and the capacity the labels were built with
+        """
+        cached = self._gauge_cache.get(pv.metadata.uid)
+        if cached is not None:
+            if cached[3] == pv_capacity:
+                return cached
+            # Capacity is one of the label values: after an expansion the
+            # series labeled with the old pv_capacity must be retired and
+            # the children rebound, or new values would keep flowing into
+            # stale-labeled series.
+            _, _, label_values, _ = self._gauge_cache.pop(pv.metadata.uid)
+            self._last_capacity.pop(pv.metadata.uid, None)
+            self.pv_used_bytes_gauge.remove(*label_values)
+            self.pv_capacity_bytes_gauge.remove(*label_values)
+
+        pvc_name = pv.spec.claim_ref.name
+        pvc_namespace = pv.spec.claim_ref.namespace
+        storage_path = (
+            pv.spec.local.path if pv.spec.local else pv.spec.host_path.path
+        )
+        try:
+            pvc = self.k8s_client.read_namespaced_persistent_volume_claim(
+                name=pvc_name, namespace=pvc_namespace
+            )
+            raw_labels = pvc.metadata.labels or {}
+        except Exception as e:
+            _logger.error(f"Failed to fetch PVC {pvc_namespace}/{pvc_name}: {e}")
+            raw_labels = {}
+        labels = {
+            "node_name": self.node_name,
+            "pvc_name": pvc_name,
+            "pvc_namespace": pvc_namespace,
+            "pv_name": pv.metadata.name,
+            "storage_path": storage_path,
+            "pv_capacity": pv_capacity,
+            "storage_class_name": pv.spec.storage_class_name,
+        }
+        labels.update(
+            {_sanitize_label_key(k): raw_labels.get(k, "") for k in self.pvc_label_keys}
+        )
+        if self.include_pvc_labels_blob:
+            promoted = set(self.pvc_label_keys)
+            remaining = {k: v for k, v in raw_labels.items() if k not in promoted}
+            labels["pvc_labels"] = json.dumps(remaining, sort_keys=True)
+
+        label_values = tuple(str(labels[name]) for name in self._pv_labelnames)
+        cached = (
+            self.pv_used_bytes_gauge.labels(**labels),
+            self.pv_capacity_bytes_gauge.labels(**labels),
+            label_values,
+            pv_capacity,
+        )
+        self._gauge_cache[pv.metadata.uid] = cached
+        return cached
+
+    def _evict_deleted_pv_gauges(self, node_pvs: list[V1PersistentVolume]):
+        """
+        Drop cached gauge children and series for PVs that no longer exist.
+
+        Without this, deleted PVs would linger as stale time series (and
+        cache entries) for the lifetime of the process.
+        """
+        current_uids = {pv.metadata.uid for pv in node_pvs}
+        for uid in list(self._gauge_cache):
+            if uid not in current_uids:
+                _, _, label_values, _ = self._gauge_cache.pop(uid)
+                self._last_capacity.pop(uid, None)
+                self.pv_used_bytes_gauge.remove(*label_values)
+                self.pv_capacity_bytes_gauge.remove(*label_values)
+
+    def _submit_mount_storage_futures(self) -> dict:
+        """Submit one get_mount_storage_info future per mount on the shared pool."""
+        return {
+            self._pool.submit(self.get_mount_storage_info, spec[0]): spec
+            for spec in self._mount_specs
+        }
+
+    def _publish_mount_storage_metrics(self, futures: dict):
+        """Publish mount gauge values as the submitted futures complete."""
+        for future in as_completed(futures):
+            path, capacity_gauge, used_gauge, available_gauge = futures[future]
+            try:
+                capacity, used, available = future.result()
+            except OSError as e:
+                _logger.error(f"Failed to get storage info for mount {path}: {e}")
+                continue
+            capacity_gauge.set(capacity)
+            used_gauge.set(used)
+            available_gauge.set(available)
 
     def update_mount_storage_metrics(self):
         """
         Update Prometheus metrics for all mounted storage volumes.
-        
-        Iterates through all discovered host path to volume mount mappings,
-        retrieves filesystem information for each mount, and updates the
-        corresponding Prometheus gauges with capacity, used, and available space.
+
+        Gathers filesystem information for all discovered mounts concurrently
+        on the shared worker pool and updates the corresponding Prometheus
+        gauges with capacity, used, and available space from this thread.
         """
-        for host_path, volume_mount_path in self.host_path_to_volume_mount.items():
-            capacity, used, available = self.get_mount_storage_info(volume_mount_path)
-            metrics.mounted_disk_capacity_gauge.labels(
-                node_name=self.node_name,
-                host_path=host_path,
-                volume_mount_path=volume_mount_path,
-            ).set(capacity)
-            metrics.mounted_disk_used_gauge.labels(
-                node_name=self.node_name,
-                host_path=host_path,
-                volume_mount_path=volume_mount_path,
-            ).set(used)
-            metrics.mounted_disk_available_gauge.labels(
-                node_name=self.node_name,
-                host_path=host_path,
-                volume_mount_path=volume_mount_path,
-            ).set(available)
+        self._publish_mount_storage_metrics(self._submit_mount_storage_futures())
 
     def update_metrics(self):
         """
         Update all storage-related Prometheus metrics.
-        
+
         Orchestrates the update of both persistent volume metrics and mounted
-        storage metrics by calling the respective update methods. This is the
-        main entry point for metric collection.
+        storage metrics. The mount filesystem stats are submitted to the
+        worker pool before the PV walks are collected, so both kinds of I/O
+        overlap within one cycle. This is the main entry point for metric
+        collection.
         """
+        mount_futures = self._submit_mount_storage_futures()
         self.update_pv_metrics()
-        self.update_mount_storage_metrics()
+        self._publish_mount_storage_metrics(mount_futures)
+
+    def shutdown(self):
+        """
+        Shut down the worker pool, cancelling any queued usage walks.
+
+        Called on SIGTERM so the process does not linger on in-flight walks
+        when Kubernetes asks it to terminate.
+        """
+        self._pool.shutdown(wait=False, cancel_futures=True)
@@ -12,9 +12,12 @@ _BASE_PV_LABELNAMES = [
 ]
 
 
-def create_pv_gauges(extra_labelnames: list[str], include_pvc_labels_blob: bool = False) -> tuple[Gauge, Gauge]:
+def create_pv_gauges(
+    extra_labelnames: list[str], include_pvc_labels_blob: bool = False
+) -> tuple[Gauge, Gauge, list[str]]:
     """
-    Create and return the PV used/capacity gauges with the given extra label names appended.
+    Create and return the PV used/capacity gauges with the given extra label names appended,
+    along with the final ordered label names (needed to remove a PV's series when it is deleted).
     Called once at exporter startup based on the configured PVC label keys.
     """
     labelnames = _BASE_PV_LABELNAMES + extra_labelnames
@@ -30,7 +33,7 @@ def create_pv_gauges(extra_labelnames: list[str], include_pvc_labels_blob: bool
         documentation="The capacity of local storage volume",
         labelnames=labelnames,
     )
-    return pv_used_bytes_gauge, pv_capacity_bytes_gauge
+    return pv_used_bytes_gauge, pv_capacity_bytes_gauge, labelnames
 
 
 mounted_disk_used_gauge = Gauge(
@@ -0,0 +1,120 @@
+"""
+ctypes binding for statx(2) with AT_STATX_DONT_SYNC.
+
+os.stat offers no way to pass statx sync flags, but on networked or
+ZFS-backed filesystems a plain stat can force an inode sync round-trip.
+AT_STATX_DONT_SYNC tells the kernel that a cached value is fine, which is
+exactly what block accounting needs. Only the fields the walkers use
+(stx_mode and stx_blocks) are requested.
+
+Falls back cleanly: available() returns False if libc has no statx symbol
+(glibc < 2.28) or the kernel rejects the call, and callers should use
+regular stat instead.
+"""
+from __future__ import annotations
+import ctypes
+import os
+import stat as stat_module
+import threading
+
+from . import utils
+
+_logger = utils.createLogger(__name__)
+
+AT_FDCWD = -100
+AT_SYMLINK_NOFOLLOW = 0x100
+AT_STATX_DONT_SYNC = 0x4000
+STATX_TYPE = 0x0001
+STATX_BLOCKS = 0x0400
+
+
+class _StatxBuf(ctypes.Structure):
+    # struct statx from <linux/stat.h>, up to stx_blocks; the kernel is
+    # given the full 256 bytes so later fields land in the padding.
+    _fields_ = [
+        ("stx_mask", ctypes.c_uint32),
+        ("stx_blksize", ctypes.c_uint32),
+        ("stx_attributes", ctypes.c_uint64),
+        ("stx_nlink", ctypes.c_uint32),
+        ("stx_uid", ctypes.c_uint32),
+        ("stx_gid", ctypes.c_uint32),
+        ("stx_mode", ctypes.c_uint16),
+        ("_spare0", ctypes.c_uint16),
+        ("stx_ino", ctypes.c_uint64),
+        ("stx_size", ctypes.c_uint64),
+        ("stx_blocks", ctypes.c_uint64),
+        ("_pad", ctypes.c_uint8 * 200),
+    ]
+
+
+# The kernel unconditionally copies out the full 256-byte struct statx,
+# so the buffer must be exactly that size or every call writes past it.
+assert ctypes.sizeof(_StatxBuf) == 256
+
+
+try:
+    _libc = ctypes.CDLL(None, use_errno=True)
+    _statx = _libc.statx
+    _statx.argtypes = [
+        ctypes.c_int,
+        ctypes.c_char_p,
+        ctypes.c_int,
+        ctypes.c_uint,
+        ctypes.POINTER(_StatxBuf),
+    ]
+    _statx.restype = ctypes.c_int
+except (OSError, AttributeError):
+    _statx = None
+
+_available: bool | None = None
+_available_lock = threading.Lock()
+
+
+def available() -> bool:
+    """
+    Check whether statx with AT_STATX_DONT_SYNC works on this system.
+
+    Probes the call once against the current directory and caches the
+    result; returns False when libc or the kernel does not support it.
+    """
+    global _available
+    if _available is not None:
+        return _available
+    with _available_lock:
+        if _available is not None:
+            return _available
+        if _statx is None:
+            _logger.debug("libc has no statx symbol, statx binding disabled")
+            _available = False
+            return _available
+        try:
+            blocks_and_isdir(".")
+            _available = True
+        except OSError as e:
+            _logger.warning(f"statx unavailable ({e}), falling back to stat")
+            _available = False
+        return _available
+
+
+def blocks_and_isdir(path: str) -> tuple[int, bool]:
+    """
+    Return (allocated 512-byte blocks, is-directory) for path.
+
+    Does not follow symlinks and passes AT_STATX_DONT_SYNC so the kernel
+    may serve cached attributes without flushing inode metadata.
+
+    Raises:
+        OSError: If the statx call fails
+    """
+    buf = _StatxBuf()
+    ret = _statx(
+        AT_FDCWD,
+        os.fsencode(path),
+        AT_SYMLINK_NOFOLLOW | AT_STATX_DONT_SYNC,
+        STATX_TYPE | STATX_BLOCKS,
+        ctypes.byref(buf),
+    )
+    if ret != 0:
+        err = ctypes.get_errno()
+        raise OSError(err, os.strerror(err), path)
+    return buf.stx_blocks, stat_module.S_ISDIR(buf.stx_mode)
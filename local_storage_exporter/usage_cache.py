@@ -0,0 +1,186 @@
+"""
+inotify-backed cache of PV usage sizes.
+
+Re-walking an entire PV tree every tick is wasted work when nothing changed.
+This cache keeps the last computed size per PV path and watches the hostpath
+roots with inotify; a tick only recomputes PVs whose subtree saw a
+create/delete/modify/move event since the last walk, so steady-state cost is
+O(#changed PVs) instead of O(total files).
+
+The 'inotify_simple' package is an optional dependency: if it is not
+installed the cache is disabled and every lookup misses, matching the old
+walk-every-tick behavior.
+"""
+from __future__ import annotations
+import os
+import threading
+from collections import deque
+
+from . import utils
+
+try:
+    from inotify_simple import INotify, flags
+except ImportError:
+    INotify = None
+
+_logger = utils.createLogger(__name__)
+
+
+class UsageCache:
+    """
+    Cache of directory sizes invalidated by inotify events.
+
+    A daemon thread consumes events from recursive watches on the given
+    roots and marks the affected directories dirty; get() misses for paths
+    with a dirty entry in their subtree so the caller recomputes them.
+    A queue overflow (IN_Q_OVERFLOW) invalidates the whole cache since
+    events were lost.
+    """
+
+    def __init__(self, roots: list[str]):
+        self._lock = threading.Lock()
+        self._sizes: dict[str, int] = {}
+        self._dirty: set[str] = set()
+        # Directories whose watch could not be set up (e.g. ENOSPC against
+        # fs.inotify.max_user_watches): changes there are invisible to
+        # invalidation, so paths touching them must never be served from
+        # the cache.
+        self._broken: set[str] = set()
+        self.enabled = INotify is not None
+        if not self.enabled:
+            _logger.debug("inotify_simple not installed, usage caching disabled")
+            return
+
+        self._watch_flags = (
+            flags.CREATE
+            | flags.DELETE
+            | flags.MODIFY
+            | flags.MOVED_FROM
+            | flags.MOVED_TO
+        )
+        self._inotify = INotify()
+        self._watched_paths: dict[int, str] = {}
+        for root in roots:
+            self._watch_tree(root)
+        threading.Thread(
+            target=self._consume_events, name="usage-cache", daemon=True
+        ).start()
+
+    def get(self, path: str) -> int | None:
+        """
+        Return the cached size for path, or None if it must be recomputed.
+
+        A miss also clears the dirty markers under path, so the caller is
+        expected to follow up with put() once it has recomputed the size.
+        """
+        if not self.enabled:
+            return None
+        prefix = path + os.sep
+        with self._lock:
+            for broken in self._broken:
+                # A watchless directory inside path (or above it) means
+                # changes can go unnoticed - permanent miss.
+                if (
+                    broken == path
+                    or broken.startswith(prefix)
+                    or path.startswith(broken + os.sep)
+                ):
+                    return None
+            dirty = [
+                d for d in self._dirty if d == path or d.startswith(prefix)
+            ]
+            if dirty:
+                self._dirty.difference_update(dirty)
+                return None
+            return self._sizes.get(path)
+
+    def put(self, path: str, size: int):
+        """Store the freshly computed size for path."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._sizes[path] = size
+
+    def invalidate(self, path: str):
+        """
+        Mark path dirty again.
+
+        get() clears the dirty markers under path on a miss, expecting a
+        put() to follow; when the recompute fails instead, the caller must
+        invalidate so the stale pre-change size is not served on the next
+        tick.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._dirty.add(path)
+
+    def _watch_tree(self, root: str):
+        """Add watches for root and all of its subdirectories."""
+        stack: deque[str] = deque([root])
+        while stack:
+            directory = stack.pop()
+            try:
+                wd = self._inotify.add_watch(directory, self._watch_flags)
+                self._watched_paths[wd] = directory
+                with os.scandir(directory) as it:
+                    stack.extend(
+                        entry.path
+                        for entry in it
+                        if entry.is_dir(follow_symlinks=False)
+                    )
+            except OSError as e:
+                _logger.error(
+                    f"Failed to watch directory {directory}: {e}; "
+                    "paths under it will not be cached"
+                )
+                with self._lock:
+                    self._broken.add(directory)
+
+    def _consume_events(self):
+        """Mark directories dirty as inotify events arrive (daemon thread)."""
+        while True:
+            try:
+                for event in self._inotify.read():
+                    if event.mask & flags.Q_OVERFLOW:
+                        # Events were lost, so nothing cached can be trusted.
+                        _logger.warning(
+                            "inotify queue overflow, invalidating usage cache"
+                        )
+                        with self._lock:
+                            self._dirty.update(self._sizes)
+                            self._dirty.update(self._watched_paths.values())
+                        continue
+                    if event.mask & flags.IGNORED:
+                        # The kernel already removed the watch (directory
+                        # deleted or unmounted): drop the wd mapping and any
+                        # state for paths under it, or both grow without
+                        # bound on churn-heavy PVs. Invalidation of covering
+                        # PVs is handled by the DELETE event the parent
+                        # watch received first.
+                        directory = self._watched_paths.pop(event.wd, None)
+                        if directory is None:
+                            continue
+                        prefix = directory + os.sep
+                        with self._lock:
+                            self._dirty = {
+                                d
+                                for d in self._dirty
+                                if d != directory and not d.startswith(prefix)
+                            }
+                            for path in list(self._sizes):
+                                if path == directory or path.startswith(prefix):
+                                    del self._sizes[path]
+                        continue
+                    directory = self._watched_paths.get(event.wd)
+                    if directory is None:
+                        continue
+                    with self._lock:
+                        self._dirty.add(directory)
+                    # New subdirectories need their own (recursive) watch.
+                    if event.mask & flags.ISDIR and event.mask & (
+                        flags.CREATE | flags.MOVED_TO
+                    ):
+                        self._watch_tree(os.path.join(directory, event.name))
+            except OSError as e:
+                _logger.error(f"Failed to read inotify events: {e}")
@@ -1,23 +1,39 @@
-import re
+import functools
 import logging
 import os
 
+# fmt: off
+_STORAGE_UNITS = {
+    "Ki": 1024, "Mi": 1024**2, "Gi": 1024**3, "Ti": 1024**4, "Pi": 1024**5, "Ei": 1024**6,
+    "k": 10**3, "M": 10**6,    "G": 10**9,    "T": 10**12,   "P": 10**15,   "E": 10**18
+}
+# fmt: on
 
-def convert_storage_capacity_to_bytes(storage_capacity: str) -> int:
-    # fmt: off
-    # Compile the regex pattern once
-    STORAGE_CAPACITY_PATTERN = re.compile(r"(\d*[,|\.]?\d+)([a-zA-Z]+)")
-    STORAGE_UNITS = {
-        "Ki": 1024, "Mi": 1024**2, "Gi": 1024**3, "Ti": 1024**4, "Pi": 1024**5, "Ei": 1024**6,
-        "k": 10**3, "M": 10**6,    "G": 10**9,    "T": 10**12,   "P": 10**15,   "E": 10**18
-    }
-    # fmt: on
 
-    match = STORAGE_CAPACITY_PATTERN.match(storage_capacity)
-    if match:
-        value, unit = match.groups()
-        if unit in STORAGE_UNITS:
-            return int(float(value) * STORAGE_UNITS[unit])
+@functools.lru_cache(maxsize=4096)
+def convert_storage_capacity_to_bytes(storage_capacity: str) -> int:
+    # Capacity strings like "100Gi" repeat across PVs and never change, so
+    # the parse is memoized. The scan below replaces the previous regex
+    # (r"(\d*[,|\.]?\d+)([a-zA-Z]+)") with the same semantics: a number with
+    # an optional decimal separator, directly followed by a unit.
+    s = storage_capacity
+    n = len(s)
+    i = 0
+    while i < n and s[i].isdigit():
+        i += 1
+    value_end = i
+    if i < n and s[i] in ",|." and i + 1 < n and s[i + 1].isdigit():
+        i += 1
+        while i < n and s[i].isdigit():
+            i += 1
+        value_end = i
+    unit_start = value_end
+    while i < n and ("a" <= s[i] <= "z" or "A" <= s[i] <= "Z"):
+        i += 1
+    value = s[:value_end]
+    unit = s[unit_start:i]
+    if value and unit and unit in _STORAGE_UNITS:
+        return int(float(value) * _STORAGE_UNITS[unit])
     return int(storage_capacity)
 
 
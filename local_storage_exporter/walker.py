@@ -0,0 +1,96 @@
+"""
+Long-lived walker subprocess and its client.
+
+An alternative to in-process walking for deployments that want the walks
+fully isolated from the exporter process: one child is spawned per exporter
+(not one fork+exec per PV per tick) and fed paths over a pipe, so the
+per-call overhead is a pipe round-trip and the child's page cache stays
+warm across ticks. Enabled with USE_WALKER_SUBPROCESS=1.
+
+Protocol: one path per line on stdin, one result line per path on stdout -
+the size in bytes, or -1 if the walk failed (details go to the child's
+stderr, which is inherited so they land in the pod log).
+"""
+from __future__ import annotations
+import subprocess
+import sys
+import threading
+
+from . import utils
+
+try:
+    from . import _walksize
+except ImportError:
+    _walksize = None
+
+_logger = utils.createLogger(__name__)
+
+
+class WalkerClient:
+    """
+    Client for the walker subprocess.
+
+    Spawns the child on first use and restarts it if it exits or the pipe
+    breaks. Calls are serialized with a lock since the protocol is one
+    request/response at a time.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._proc: subprocess.Popen | None = None
+
+    def size(self, path: str) -> int | None:
+        """
+        Measure path in the walker subprocess.
+
+        Returns:
+            int | None: Size in bytes, or None if the walk failed
+
+        Raises:
+            OSError: If the child cannot be spawned or dies mid-request
+        """
+        with self._lock:
+            if self._proc is None or self._proc.poll() is not None:
+                self._proc = subprocess.Popen(
+                    [sys.executable, "-m", "local_storage_exporter.walker"],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    text=True,
+                    bufsize=1,
+                )
+            try:
+                self._proc.stdin.write(path + "\n")
+                self._proc.stdin.flush()
+                line = self._proc.stdout.readline()
+            except OSError:
+                self._proc.kill()
+                self._proc = None
+                raise
+            if not line:
+                # Child exited (EOF); next call respawns it.
+                self._proc.wait()
+                self._proc = None
+                raise OSError(f"walker subprocess exited while measuring {path}")
+        size = int(line)
+        return size if size >= 0 else None
+
+
+def main():
+    """Child loop: read one path per line, answer with its size (or -1)."""
+    # Imported here: k8s imports this module for WalkerClient.
+    from .k8s import _walk_size
+
+    size_fn = _walksize.walksize if _walksize is not None else _walk_size
+    for line in sys.stdin:
+        path = line.rstrip("\n")
+        if not path:
+            continue
+        try:
+            print(size_fn(path), flush=True)
+        except OSError as e:
+            print(f"walker: failed to measure {path}: {e}", file=sys.stderr)
+            print(-1, flush=True)
+
+
+if __name__ == "__main__":
+    main()